@@ -5,12 +5,16 @@ Demonstrates basic I2C communication with configuration options.
 """
 
 import argparse
+import binascii
 import sys
 
 # Import BPIO client and I2C interface
 from pybpio.bpio_client import BPIOClient
 from pybpio.bpio_i2c import BPIOI2C
 
+# Hex dump ASCII column: printable bytes as-is, everything else as '.'
+_PRINTABLE = bytes(i if 32 <= i < 127 else 0x2E for i in range(256))
+
 def i2c_scan_example(client):
     """I2C Scan example with status display."""
     i2c = BPIOI2C(client)
@@ -48,6 +52,7 @@ def i2c_basic_example(client, device_addr=0xA0, register_addr=0x00, read_bytes=8
         
         # Perform I2C read
         print(f"\nReading {read_bytes} bytes from device 0x{device_addr:02X}, register 0x{register_addr:02X}...")
+        # Register address write and data read in one transaction (repeated START)
         data = i2c.transfer(write_data=[device_addr, register_addr], read_bytes=read_bytes)
         
         if data:
@@ -62,25 +67,37 @@ def i2c_basic_example(client, device_addr=0xA0, register_addr=0x00, read_bytes=8
     
     return True
 
-def i2c_eeprom_dump(client, device_addr=0xA0, size=256):
+def i2c_eeprom_dump(client, device_addr=0xA0, size=256, page_size=16):
     """Read entire EEPROM contents."""
+    # Pages are addressed with a one-byte word address, as on a 24x02
+    if size > 256:
+        print(f"EEPROM dump size {size} exceeds the 256 bytes a one-byte word address can reach")
+        return False
+
     i2c = BPIOI2C(client)
     
     if i2c.configure(speed=400000, pullup_enable=True, psu_enable=True, 
                     psu_set_mv=3300, psu_set_ma=0):
         
         print(f"Reading {size} bytes from EEPROM at 0x{device_addr:02X}...")
-        data = i2c.transfer(write_data=[device_addr, 0x00], read_bytes=size)
+        # One page read per transaction (address write, repeated START, read),
+        # all pages sent together in a single USB round trip
+        ops = [{'write_data': [device_addr, offset],
+                'read_bytes': min(page_size, size - offset)}
+               for offset in range(0, size, page_size)]
+        pages = i2c.transfer_batch(ops)
+        data = None
+        if pages and all(pages):
+            data = b''.join(pages)
         
         if data:
             print(f"EEPROM dump ({len(data)} bytes):")
             # Print in hex dump format
             for i in range(0, len(data), 16):
-                addr = i
-                hex_part = ' '.join(f'{data[j]:02X}' for j in range(i, min(i+16, len(data))))
-                ascii_part = ''.join(chr(data[j]) if 32 <= data[j] < 127 else '.' 
-                                   for j in range(i, min(i+16, len(data))))
-                print(f"{addr:04X}: {hex_part:<47} {ascii_part}")
+                row = data[i:i+16]
+                hex_part = binascii.hexlify(row, b' ').decode().upper()
+                ascii_part = row.translate(_PRINTABLE).decode('latin1')
+                print(f"{i:04X}: {hex_part:<47} {ascii_part}")
         else:
             print("Failed to read EEPROM data")
             return False
@@ -146,14 +146,13 @@ def test_onboard(client):
     
     # Breathing effect (fade red in and out)
     print("\nBreathing effect (red)...")
+    # Build the frames once, the onboard LED takes RGB bytes as-is
+    fade_in = [bytes((brightness, 0, 0)) for brightness in range(0, 256, 16)]
+    fade_out = [bytes((brightness, 0, 0)) for brightness in range(255, -1, -16)]
     for _ in range(2):
-        # Fade in
-        for brightness in range(0, 256, 16):
-            led.set_rgb(brightness, 0, 0)
-            time.sleep(0.05)
-        # Fade out
-        for brightness in range(255, -1, -16):
-            led.set_rgb(brightness, 0, 0)
+        for frame in fade_in + fade_out:
+            # Don't wait for the ACK, the step timing is set by the sleep
+            led.set_rgb_bytes(frame, wait=False)
             time.sleep(0.05)
     
     # Turn off
@@ -0,0 +1,31 @@
+"""
+Reusable byte buffers for high rate reads
+
+A small LIFO pool of bytearrays. Buffers are handed out with get_buffer()
+and must be given back with return_buffer() once the caller is done with
+them, so tight read loops reuse the same storage instead of allocating a
+new buffer per read. The most recently returned buffer is reused first
+while it is still warm in cache.
+"""
+
+import threading
+
+class BufferPool:
+    def __init__(self, buffer_size=256, max_buffers=8):
+        self.buffer_size = buffer_size  # Minimum size of new buffers
+        self.max_buffers = max_buffers  # Free buffers kept, extras are dropped
+        self._free = []
+        self._lock = threading.Lock()
+
+    def get_buffer(self, size):
+        """Get a buffer of at least size bytes"""
+        with self._lock:
+            if self._free and len(self._free[-1]) >= size:
+                return self._free.pop()
+        return bytearray(max(size, self.buffer_size))
+
+    def return_buffer(self, buf):
+        """Give a buffer from get_buffer() back to the pool"""
+        with self._lock:
+            if len(self._free) < self.max_buffers:
+                self._free.append(buf)
@@ -0,0 +1,38 @@
+"""
+Compiled LED frame packers for BPIOLED
+
+Optional Numba kernel that writes the reordered WS2812 (GRB), onboard (RGB)
+or APA102 (brightness, BGR) frame straight into a preallocated output array,
+with no intermediate arrays. Used by BPIOLED.set_multiple_rgb() for long
+strips when numba is installed; otherwise HAVE_NUMBA is False and the NumPy
+or pure Python packers are used instead.
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Below this many LEDs the NumPy path is already fast enough, and short
+# strips shouldn't pay the one-off JIT compile
+MIN_LEDS = 128
+
+if HAVE_NUMBA:
+    @njit(cache=True, boundscheck=False)
+    def pack_frame(src, dst, p0, p1, p2, prefix):
+        """Pack (N, 3) uint8 RGB colors into dst, one LED frame per color
+
+        p0, p1, p2 index the source channel for each output color byte. If
+        prefix is 0-255 it is written before each LED's colors (APA102
+        brightness byte); a negative prefix means no prefix byte.
+        """
+        j = 0
+        for i in range(src.shape[0]):
+            if prefix >= 0:
+                dst[j] = prefix
+                j += 1
+            dst[j] = src[i, p0]
+            dst[j + 1] = src[i, p1]
+            dst[j + 2] = src[i, p2]
+            j += 3
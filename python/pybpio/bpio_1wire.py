@@ -5,13 +5,17 @@ class BPIO1Wire(BPIOBase):
         super().__init__(client)
    
     def configure(self, **kwargs):
-        """Configure 1-Wire mode"""
+        """Configure 1-Wire mode
+
+        An identical repeat of the last configure() is skipped (no request is
+        sent); pass force=True to send it anyway.
+        """
         kwargs['mode'] = '1Wire'
         #get the existing mode_configuration from kwargs or create a new one
         mode_configuration = kwargs.get('mode_configuration', {})
         # Replace the mode_configuration in kwargs
         kwargs['mode_configuration'] = mode_configuration        
-        success = self.client.configuration_request(**kwargs)  
+        success = self._configure(**kwargs)
         self.configured = success
         return success
 
@@ -1,3 +1,19 @@
+def _config_key(value):
+    """Internal: Hashable snapshot of configuration kwargs"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _config_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_config_key(v) for v in value)
+    return value
+
+# configure() parameters that perform an action rather than describe a mode
+# setting; a request carrying any of them is always sent and never cached
+_ONE_SHOT_CONFIG = frozenset((
+    'print_string', 'led_resume', 'led_color',
+    'hardware_reset', 'hardware_bootloader', 'hardware_selftest',
+    'io_value', 'io_value_mask', 'io_direction', 'io_direction_mask',
+))
+
 class BPIOBase:  
     def __init__(self, client):
         self.client = client
@@ -10,6 +26,30 @@ class BPIOBase:
             return False
         return True    
     
+    def _configure(self, force=False, **kwargs):
+        """Internal: Send a mode configuration, skipped if it is already applied
+
+        The last successful configure() parameters are remembered on the
+        client, so a new mode instance configured the same way (as the
+        examples do) doesn't pay for another configuration round trip. Any
+        other configuration request clears the cache.
+
+        Requests with one-shot actions (print_string, hardware_reset, IO
+        writes, ...) are always sent and not remembered. force=True sends
+        the request even if it matches, e.g. to recover after a PSU trip or
+        a mode change made from the Bus Pirate terminal, which the host
+        can't see (client.invalidate_config() does the same for the next
+        configure()).
+        """
+        one_shot = not _ONE_SHOT_CONFIG.isdisjoint(kwargs)
+        key = (self.__class__.__name__, _config_key(kwargs))
+        if not force and not one_shot and key == self.client._last_config_key:
+            return True
+        success = self.client.configuration_request(**kwargs)
+        if success and not one_shot:
+            self.client._last_config_key = key
+        return success
+
     def configuration_request(self, **kwargs):
         """Pass configuration parameters to the client"""
         if not self.config_check():
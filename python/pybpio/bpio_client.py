@@ -5,6 +5,7 @@ import os
 import sys
 import threading
 import queue
+import select
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,26 +27,56 @@ import tooling.bpio.StatusRequestTypes as StatusRequestTypes
 import tooling.bpio.StatusResponse as StatusResponse
 #import tooling.bpio.ErrorResponse as ErrorResponse
 
+from .bpio_serial_proc import SerialWorker, enable_low_latency
+
 class BPIOClient:
-    def __init__(self, port, baudrate=3000000, timeout=2, debug=False, minimum_version=2):
+    def __init__(self, port, baudrate=3000000, timeout=2, debug=False, minimum_version=2, serial_process=False):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.debug = debug
         self.serial_port = None
+        self._worker = None  # SerialWorker process when serial_process=True
+        self._rx_fd = None   # Port file descriptor, read directly by the router on POSIX
+        self._rx_buf = None  # Preallocated router read buffer
         self.version_flatbuffers_major = 2
         self.minimum_version_flatbuffers_minor = minimum_version
         
-        # Packet routing queues
-        self._sync_queue = queue.Queue()   # For sync request/response
-        self._async_queue = queue.Queue()  # For async DataResponse packets
+        # Packet routing queues, filled by the router thread (C implemented
+        # SimpleQueue: no Python level lock/condition on put and get)
+        self._sync_queue = queue.SimpleQueue()   # For sync request/response
+        self._async_queue = queue.SimpleQueue()  # For async DataResponse packets
         self._router_running = False
         self._router_thread = None
         self._pending_sync_request = False  # Flag to indicate we're waiting for a sync response
+        self._last_config_key = None  # Last mode configuration applied, see BPIOBase._configure()
+        self._mode_limits = None      # (max write, max read) of the current mode, see mode_limits()
+        self._fast_builder = flatbuffers.Builder(1024)  # Reused by data_request_fast()
+        
+        # Requests sent without waiting (await_response=False) whose responses
+        # are still due; the router drops those responses instead of queuing them
+        self.max_in_flight = 4
+        self._unacked = 0
+        self._unacked_cond = threading.Condition()
         
-        # Open serial port
+        # Open serial port, either in-process or in a worker process
         try:
-            self.serial_port = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+            if serial_process:
+                self._worker = SerialWorker(self.port, self.baudrate)
+                self._worker.start()
+                error = self._worker.wait_ready(self.timeout)
+                if error:
+                    self._worker.stop()
+                    self._worker = None
+                    raise serial.SerialException(error)
+            else:
+                self.serial_port = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+                low_latency = enable_low_latency(self.serial_port)
+                if self.debug:
+                    print(f"Low latency mode: {'on' if low_latency else 'not supported'}")
+                if os.name == 'posix':
+                    self._rx_fd = self.serial_port.fileno()
+                    self._rx_buf = memoryview(bytearray(65536))
             if self.debug:
                 print(f"Opened serial port {self.port} at {self.baudrate} baud")
         except serial.SerialException as e:
@@ -70,6 +101,11 @@ class BPIOClient:
     def close(self):
         """Close the serial port and stop router thread"""
         self._stop_router()
+        if self._worker:
+            self._worker.stop()
+            self._worker = None
+            if self.debug:
+                print(f"Closed serial port {self.port}")
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
             if self.debug:
@@ -100,20 +136,58 @@ class BPIOClient:
         if self.debug:
             print("Router thread stopped")
     
+    def _port_open(self):
+        """Check if the serial port (or worker process) is open"""
+        if self._worker:
+            return self._worker.is_running()
+        return self.serial_port is not None and self.serial_port.is_open
+
+    def _read_chunk(self):
+        """Read whatever bytes are available from the port, b'' if none
+
+        On POSIX the result is a view into a reused buffer, only valid until
+        the next call.
+        """
+        if self._worker:
+            return self._worker.read_chunk(timeout=0.01)
+
+        if self._rx_fd is not None:
+            # Block in the kernel until bytes arrive, timing out periodically
+            # so the router can notice it has been stopped
+            ready, _, _ = select.select([self._rx_fd], [], [], 0.1)
+            if not ready:
+                return b''
+            # The port is non-blocking: read everything pending straight into
+            # the preallocated buffer, no bytes object per read
+            try:
+                n = os.readv(self._rx_fd, [self._rx_buf])
+            except BlockingIOError:
+                return b''
+            if n == 0:
+                raise serial.SerialException("Port ready to read but returned no data (device disconnected?)")
+            return self._rx_buf[:n]
+
+        available = self.serial_port.in_waiting
+        if available > 0:
+            return self.serial_port.read(available)
+
+        # No select() on Windows serial handles, small sleep to prevent busy waiting
+        time.sleep(0.001)
+        return b''
+
     def _router_loop(self):
         """Router thread: continuously reads packets and routes to appropriate queue"""
         resp_encoded = bytearray()
         
         while self._router_running:
             try:
-                if not self.serial_port or not self.serial_port.is_open:
+                if not self._port_open():
                     time.sleep(0.01)
                     continue
                 
                 # Check for available data
-                available = self.serial_port.in_waiting
-                if available > 0:
-                    chunk = self.serial_port.read(available)
+                chunk = self._read_chunk()
+                if chunk:
                     resp_encoded.extend(chunk)
                     
                     # Process all complete packets in buffer
@@ -155,12 +229,12 @@ class BPIOClient:
                                         print(f"Router: async DataResponse -> async_queue")
                                 else:
                                     # Sync response -> sync queue
-                                    self._sync_queue.put(packet_data)
+                                    self._route_sync(packet_data)
                                     if self.debug:
                                         print(f"Router: sync DataResponse -> sync_queue")
                             else:
                                 # All other responses (Config, Status) -> sync queue
-                                self._sync_queue.put(packet_data)
+                                self._route_sync(packet_data)
                                 if self.debug:
                                     print(f"Router: {contents_type} -> sync_queue")
                                     
@@ -168,22 +242,93 @@ class BPIOClient:
                             if self.debug:
                                 print(f"Router: parse error: {e}")
                             # Put raw data in sync queue as fallback
-                            self._sync_queue.put(packet_data)
-                else:
-                    # No data available, small sleep to prevent busy waiting
-                    time.sleep(0.001)
+                            self._route_sync(packet_data)
                     
             except Exception as e:
                 if self.debug:
                     print(f"Router error: {e}")
                 time.sleep(0.01)
         
+    def _route_sync(self, packet_data):
+        """Internal: Queue a sync response, or consume it if a no-wait request owns it"""
+        with self._unacked_cond:
+            if self._unacked:
+                self._unacked -= 1
+                self._unacked_cond.notify_all()
+                self._check_unacked_response(packet_data)
+                return
+        self._sync_queue.put(packet_data)
+
+    def _check_unacked_response(self, packet_data):
+        """Internal: Report errors in a response nobody is waiting for"""
+        try:
+            resp_packet = ResponsePacket.ResponsePacket.GetRootAsResponsePacket(packet_data, 0)
+            if resp_packet.Error():
+                print(f"Error: {resp_packet.Error().decode('utf-8')}")
+            elif resp_packet.ContentsType() == ResponsePacketContents.ResponsePacketContents.DataResponse:
+                data_resp = DataResponse.DataResponse()
+                data_resp.Init(resp_packet.Contents().Bytes, resp_packet.Contents().Pos)
+                if data_resp.Error():
+                    print(f"Data request error: {data_resp.Error().decode('utf-8')}")
+        except Exception as e:
+            if self.debug:
+                print(f"Router: parse error: {e}")
+
+    def _wait_unacked(self, limit=0):
+        """Internal: Wait until at most limit no-wait requests are outstanding
+
+        Returns True once they are, False on timeout. The outstanding count
+        is kept on timeout, so late responses are still consumed by the
+        router instead of being taken as the answer to a later request.
+        """
+        with self._unacked_cond:
+            if not self._unacked_cond.wait_for(lambda: self._unacked <= limit, timeout=self.timeout):
+                print(f"Timeout waiting for {self._unacked} pending responses")
+                return False
+        return True
+
+    def send_no_wait(self, data):
+        """Send COBS-encoded data to serial port without waiting for the response
+
+        The response is checked and discarded by the router. At most
+        max_in_flight requests are outstanding; beyond that this blocks until
+        the oldest is answered. Returns True if sent, False on error.
+        Requests sent while no-wait responses are overdue fail rather than
+        risk receiving one of them.
+        """
+        if not self._port_open():
+            print("Serial port is not open")
+            return False
+
+        if not self._wait_unacked(self.max_in_flight - 1):
+            return False
+        packet = cobs.encode(data) + b'\x00'
+        # Count the request before writing so the router can't see its
+        # response first
+        with self._unacked_cond:
+            self._unacked += 1
+        try:
+            if self._worker:
+                self._worker.write(packet)
+            else:
+                self.serial_port.write(packet)
+            return True
+        except Exception as e:
+            print(f"Serial communication error: {e}")
+            with self._unacked_cond:
+                self._unacked -= 1
+        return False
+
     def send_and_receive(self, data):
         """Send COBS-encoded data to serial port and receive COBS-encoded response via router"""
-        if not self.serial_port or not self.serial_port.is_open:
+        if not self._port_open():
             print("Serial port is not open")
             return None
         
+        # Responses to earlier no-wait requests come first
+        if not self._wait_unacked():
+            return None
+        
         # Clear the sync queue of any stale responses
         while not self._sync_queue.empty():
             try:
@@ -194,7 +339,10 @@ class BPIOClient:
         try:           
             # Send COBS-encoded data followed by delimiter (0x00)
             packet = cobs.encode(data) + b'\x00'
-            self.serial_port.write(packet)
+            if self._worker:
+                self._worker.write(packet)
+            else:
+                self.serial_port.write(packet)
             
             if self.debug:
                 print(f"Sent {len(data)} bytes (original data)")
@@ -215,6 +363,53 @@ class BPIOClient:
         except Exception as e:
             print(f"Error: {e}")
         return None
+
+    def send_and_receive_batch(self, packets):
+        """Send several packets in one write and receive their responses in order
+
+        All packets are COBS-encoded and written back to back, then one
+        response per packet is collected from the sync queue. Returns the list
+        of responses, or None if the port is closed or a response times out.
+        """
+        if not self._port_open():
+            print("Serial port is not open")
+            return None
+
+        # Responses to earlier no-wait requests come first
+        if not self._wait_unacked():
+            return None
+
+        # Clear the sync queue of any stale responses
+        while not self._sync_queue.empty():
+            try:
+                self._sync_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        try:
+            stream = b''.join(cobs.encode(data) + b'\x00' for data in packets)
+            if self._worker:
+                self._worker.write(stream)
+            else:
+                self.serial_port.write(stream)
+
+            if self.debug:
+                print(f"Sent {len(packets)} packets, {len(stream)} bytes total")
+
+            responses = []
+            for _ in packets:
+                try:
+                    responses.append(self._sync_queue.get(timeout=self.timeout))
+                except queue.Empty:
+                    print(f"Timeout waiting for response {len(responses) + 1} of {len(packets)}")
+                    return None
+            return responses
+
+        except serial.SerialException as e:
+            print(f"Serial communication error: {e}")
+        except Exception as e:
+            print(f"Error: {e}")
+        return None
     
     def _expected_response(self, request_type):
         """Get the expected response type for a given request type"""
@@ -227,12 +422,13 @@ class BPIOClient:
         else:
             return None
 
-    def check_async_data(self, timeout=0):
+    def check_async_data(self, timeout=0, copy=True):
         """Check for asynchronous DataResponse from the async queue.
 
         Returns a dict with keys:
           - 'is_async' (bool)
-          - 'data_read' (list of ints)
+          - 'data_read' (bytes, or a read-only memoryview into the received
+            packet if copy=False; the view keeps the packet alive)
           - 'error' (str or None)
         Returns None if no data available within timeout.
         """
@@ -244,6 +440,9 @@ class BPIOClient:
         except queue.Empty:
             return None
 
+        if resp_data is None:
+            return None  # Woken by interrupt_async_wait()
+
         try:
             resp_packet = ResponsePacket.ResponsePacket.GetRootAsResponsePacket(resp_data, 0)
         except Exception:
@@ -253,13 +452,15 @@ class BPIOClient:
         if resp_packet.ContentsType() == ResponsePacketContents.ResponsePacketContents.DataResponse:
             data_resp = DataResponse.DataResponse()
             data_resp.Init(resp_packet.Contents().Bytes, resp_packet.Contents().Pos)
-            data = []
+            data = b''
             if data_resp.DataReadLength() > 0:
                 try:
-                    arr = data_resp.DataReadAsNumpy()
-                    data = list(arr.tobytes())
+                    # Zero copy view of the packet buffer
+                    data = memoryview(data_resp.DataReadAsNumpy())
+                    if copy:
+                        data = data.tobytes()
                 except Exception:
-                    data = [data_resp.DataRead(i) for i in range(data_resp.DataReadLength())]
+                    data = bytes(data_resp.DataRead(i) for i in range(data_resp.DataReadLength()))
 
             return {
                 'is_async': bool(data_resp.IsAsync()),
@@ -269,6 +470,10 @@ class BPIOClient:
 
         return None
     
+    def interrupt_async_wait(self):
+        """Wake a thread blocked in check_async_data(), which returns None"""
+        self._async_queue.put(None)
+
     def clear_async_queue(self):
         """Clear all pending async data from the queue"""
         while not self._async_queue.empty():
@@ -279,7 +484,14 @@ class BPIOClient:
 
     def send_request(self, builder, request_contents_type, request_contents):
         """Send a request packet and return the response"""
-        """Wrap contents in a RequestPacket"""
+        data = self._finish_request(builder, request_contents_type, request_contents)
+    
+        resp_data = self.send_and_receive(data)
+
+        return self._parse_response(resp_data, request_contents_type)
+
+    def _finish_request(self, builder, request_contents_type, request_contents):
+        """Internal: Wrap contents in a RequestPacket and return the packet bytes"""
         RequestPacket.Start(builder)
         RequestPacket.AddVersionMajor(builder, self.version_flatbuffers_major)  # BPIO2
         RequestPacket.AddMinimumVersionMinor(builder, self.minimum_version_flatbuffers_minor) # Minimum flatbuffers version required
@@ -287,10 +499,10 @@ class BPIOClient:
         RequestPacket.AddContents(builder, request_contents)
         final_packet = RequestPacket.End(builder)
         builder.Finish(final_packet)
-        data = builder.Output()
-    
-        resp_data = self.send_and_receive(data)
+        return builder.Output()
 
+    def _parse_response(self, resp_data, request_contents_type):
+        """Internal: Decode a response packet, False if missing or unexpected"""
         if not resp_data:
             return False
 
@@ -313,8 +525,33 @@ class BPIOClient:
 
         return resp_packet
     
+    def invalidate_config(self):
+        """Forget the last applied mode configuration
+
+        The next configure() is then always sent to the device, even if it
+        repeats the previous one. Use after changes the host can't see, such
+        as a PSU overcurrent trip or a mode change from the terminal port.
+        """
+        self._last_config_key = None
+        self._mode_limits = None
+
+    def mode_limits(self):
+        """Max write and read sizes of the current mode, as (max_write, max_read)
+
+        Read with one status request the first time after a configuration
+        change, then cached on the client so every mode instance shares it.
+        0 means no limit reported.
+        """
+        if self._mode_limits is None:
+            status = self.status_request(mode=True) or {}
+            self._mode_limits = (status.get('mode_max_write') or 0,
+                                 status.get('mode_max_read') or 0)
+        return self._mode_limits
+
     def configuration_request(self, **kwargs):
         """Create a BPIO ConfigurationRequest packet"""
+        # Any configuration change invalidates the cached mode configuration
+        self.invalidate_config()
         builder = flatbuffers.Builder(1024)
 
         mode_string = None
@@ -582,9 +819,66 @@ class BPIOClient:
         else:
             print("Failed to get status information.")
 
-    def data_request(self, start_main=False, start_alt=False, data_write=None, bytes_read=0, stop_main=False, stop_alt=False):
-        """Create a BPIO DataRequest packet"""
-        builder = flatbuffers.Builder(1024)
+    def data_request(self, start_main=False, start_alt=False, data_write=None, bytes_read=0, stop_main=False, stop_alt=False, out=None, await_response=True):
+        """Create a BPIO DataRequest packet
+
+        If out (a writable buffer) is given, the data read is copied straight
+        into it from the response and the number of bytes copied is returned
+        (0 if none) instead of a new bytes object. A buffer shorter than
+        bytes_read fails with False before anything is sent.
+
+        With await_response=False the request is sent without waiting for the
+        response (write-only requests such as LED frames), see send_no_wait().
+        Returns True once sent; device errors are only printed.
+        """
+        if out is not None and len(out) < bytes_read:
+            print(f"Buffer too small: {len(out)} bytes for a {bytes_read} byte read")
+            return False
+        data = self._build_data_request(start_main, start_alt, data_write, bytes_read, stop_main, stop_alt)
+        if not await_response:
+            return self.send_no_wait(data)
+        resp_data = self.send_and_receive(data)
+        resp_packet = self._parse_response(resp_data, RequestPacketContents.RequestPacketContents.DataRequest)
+        return self._data_result(resp_packet, out)
+
+    def data_request_fast(self, data_write=None, bytes_read=0, start_main=False, stop_main=False):
+        """DataRequest for hot write/read loops
+
+        Same result as data_request(), with positional arguments and one
+        flatbuffers.Builder reused across calls instead of a new one per
+        request. Not for concurrent use from several threads.
+        """
+        builder = self._fast_builder
+        builder.Clear()
+        data = self._build_data_request(start_main, False, data_write, bytes_read, stop_main, False, builder)
+        resp_data = self.send_and_receive(data)
+        resp_packet = self._parse_response(resp_data, RequestPacketContents.RequestPacketContents.DataRequest)
+        return self._data_result(resp_packet)
+
+    def data_request_batch(self, requests):
+        """Send several DataRequests in one USB write
+
+        requests is a list of dicts of data_request() keyword arguments. The
+        packets are pipelined: all are written at once and the responses are
+        read back in order, so the batch costs one round trip instead of one
+        per request. Keep batches within what the device can buffer.
+
+        Returns a list with one data_request() style result per request
+        (bytes, None or False), or False if the batch failed.
+        """
+        packets = [self._build_data_request(**request) for request in requests]
+        responses = self.send_and_receive_batch(packets)
+        if responses is None:
+            return False
+
+        request_type = RequestPacketContents.RequestPacketContents.DataRequest
+        return [self._data_result(self._parse_response(resp_data, request_type))
+                for resp_data in responses]
+
+    def _build_data_request(self, start_main=False, start_alt=False, data_write=None, bytes_read=0, stop_main=False, stop_alt=False, builder=None):
+        """Internal: Build a DataRequest packet and return the packet bytes"""
+        if builder is None:
+            builder = flatbuffers.Builder(1024)
 
         data_write_vector = None
         if data_write and len(data_write) > 0:
@@ -606,8 +900,10 @@ class BPIOClient:
             DataRequest.AddStopAlt(builder, True)
 
         data_request = DataRequest.End(builder)
-        resp_packet = self.send_request(builder, RequestPacketContents.RequestPacketContents.DataRequest, data_request)
-        
+        return self._finish_request(builder, RequestPacketContents.RequestPacketContents.DataRequest, data_request)
+
+    def _data_result(self, resp_packet, out=None):
+        """Internal: Data read from a DataResponse, None if none, False on error"""
         if not resp_packet:
             return False
                     
@@ -622,8 +918,13 @@ class BPIOClient:
         if data_resp.DataReadLength() > 0:
             data_bytes = data_resp.DataReadAsNumpy()
             if self.debug:  print(f"Data read: {' '.join(f'{b:02x}' for b in data_bytes)}")
+            if out is not None:
+                # data_request() checked that out holds bytes_read bytes
+                n = len(data_bytes)
+                memoryview(out)[:n] = data_bytes
+                return n
             return data_bytes.tobytes()
+        elif out is not None:
+            return 0
         else:
-            return None
-            
-        return b''
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -5,7 +5,11 @@ class BPIOI2C(BPIOBase):
         super().__init__(client)
     
     def configure(self, speed = 400000, clock_stretch = False, **kwargs):
-        """Configure I2C mode"""
+        """Configure I2C mode
+
+        An identical repeat of the last configure() is skipped (no request is
+        sent); pass force=True to send it anyway.
+        """
         kwargs['mode'] = 'I2C'
         #get the existing mode_configuration from kwargs or create a new one
         mode_configuration = kwargs.get('mode_configuration', {})
@@ -15,7 +19,7 @@ class BPIOI2C(BPIOBase):
         # Replace the mode_configuration in kwargs
         kwargs['mode_configuration'] = mode_configuration
 
-        success = self.client.configuration_request(**kwargs)         
+        success = self._configure(**kwargs)
         self.configured = success
         return success
     
@@ -56,9 +60,18 @@ class BPIOI2C(BPIOBase):
         )   
     
     def transfer(self, write_data=None, read_bytes=0):
-        """Perform an I2C transaction"""
+        """Perform an I2C transaction
+
+        The whole transaction is sent as a single request: START, write_data,
+        repeated START, read_bytes, STOP. There is no STOP between the write
+        and the read, and it costs one USB round trip. Transfers that don't fit
+        in one request fail here instead of being split, returning False as
+        for a device error.
+        """
         if not self.config_check():
             return None
+        if not self._fits_one_request(write_data, read_bytes):
+            return False
             
         return self.client.data_request(
             start_main=True,
@@ -67,6 +80,45 @@ class BPIOI2C(BPIOBase):
             stop_main=True
         )
     
+    def transfer_batch(self, ops):
+        """Perform several I2C transactions in one USB round trip
+
+        Args:
+            ops: list of dicts with optional 'write_data' and 'read_bytes' keys,
+                 each one a transfer() (START, write, repeated START, read, STOP)
+
+        Returns:
+            List with one transfer() result per op, None if not configured, or
+            False if an op doesn't fit in one request or the batch failed
+        """
+        if not self.config_check():
+            return None
+        for op in ops:
+            if not self._fits_one_request(op.get('write_data'), op.get('read_bytes', 0)):
+                return False
+
+        requests = [{
+            'start_main': True,
+            'data_write': op.get('write_data'),
+            'bytes_read': op.get('read_bytes', 0),
+            'stop_main': True,
+        } for op in ops]
+        return self.client.data_request_batch(requests)
+    
+    def _fits_one_request(self, write_data, read_bytes):
+        """Internal: Check a transfer against the mode's max write/read sizes"""
+        if not write_data and not read_bytes:
+            return True
+        max_write, max_read = self.client.mode_limits()
+
+        if max_write and write_data and len(write_data) > max_write:
+            print(f"I2C write of {len(write_data)} bytes exceeds max write ({max_write} bytes)")
+            return False
+        if max_read and read_bytes and read_bytes > max_read:
+            print(f"I2C read of {read_bytes} bytes exceeds max read ({max_read} bytes)")
+            return False
+        return True
+    
     def scan(self, start_addr=0x00, end_addr=0x7F):
         """Scan for I2C devices"""
         if not self.config_check():
@@ -27,7 +27,41 @@ Usage:
     client.close()
 """
 
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .bpio_base import BPIOBase
+from . import _led_pack
+
+# Pure Python fallback: strips up to this many LEDs get a generated packer
+# specialized for their length, keeping at most _PACKER_CACHE_SIZE of them
+_MAX_UNROLL_LEDS = 1024
+_PACKER_CACHE_SIZE = 16
+
+def _build_packer(num_leds, perm, has_prefix):
+    """Generate a packer for a fixed strip length and frame layout
+
+    The generated function unpacks every (r, g, b) tuple into locals and
+    writes the whole frame into out with one slice assignment; there is no
+    loop and no layout branching. With has_prefix the APA102 brightness
+    byte is the prefix argument, so one packer serves every brightness.
+    """
+    unpack = ", ".join(f"(c{i}_0, c{i}_1, c{i}_2)" for i in range(num_leds))
+    values = []
+    for i in range(num_leds):
+        if has_prefix:
+            values.append("prefix")
+        values.extend(f"c{i}_{p}" for p in perm)
+    src = (f"def _pack(colors, out, prefix):\n"
+           f"    {unpack}, = colors\n"
+           f"    out[0:{len(values)}] = ({', '.join(values)},)\n")
+    namespace = {}
+    exec(src, namespace)
+    return namespace['_pack']
 
 class BPIOLED(BPIOBase):
     # LED type constants
@@ -38,13 +72,29 @@ class BPIOLED(BPIOBase):
     def __init__(self, client):
         super().__init__(client)
         self.led_type = None
+        # Frame layout for the configured LED type, set by configure()
+        self._stride = None  # Bytes per LED
+        self._perm = None    # Index into (r, g, b) for each color byte
+        self._pfx = None     # APA102 brightness prefix bits, None if no prefix
+        # Reusable frame buffer for the generated packers in set_multiple_rgb()
+        self._frame_buf = bytearray()
+        # APA102 frame with brightness bytes prefilled, kept while brightness
+        # and strip length are unchanged so only color bytes are rewritten
+        self._apa_prev_brightness = None
+        self._apa_scaffold = None
+        # Output array for the compiled packers, grown as needed
+        self._frame_out = None
+        # Generated packers keyed by (perm, num_leds, has_prefix)
+        self._packer_cache = {}
         
     def configure(self, led_type='WS2812', **kwargs):
         """Configure LED mode
         
         Args:
             led_type (str or int): LED type - 'WS2812', 'APA102', or 'ONBOARD' (or 0, 1, 2)
-            **kwargs: Additional configuration parameters
+            **kwargs: Additional configuration parameters. force=True sends the
+                      configuration even if it repeats the last one, which is
+                      otherwise skipped without a request
             
         Returns:
             bool: True if configuration successful, False otherwise
@@ -73,18 +123,34 @@ class BPIOLED(BPIOBase):
         
         self.led_type = submode
         
+        # Precompute the frame layout so the set_* methods don't dispatch on type
+        if submode == self.LED_WS2812:
+            # WS2812 format: GRB
+            self._stride, self._perm, self._pfx = 3, (1, 0, 2), None
+        elif submode == self.LED_ONBOARD:
+            # Onboard RGB format: RGB
+            self._stride, self._perm, self._pfx = 3, (0, 1, 2), None
+        else:
+            # APA102 format: brightness byte (3 MSB = 111) then BGR
+            self._stride, self._perm, self._pfx = 4, (2, 1, 0), 0xE0
+        
         # Get the existing mode_configuration from kwargs or create a new one
         mode_configuration = kwargs.get('mode_configuration', {})
         mode_configuration['submode'] = submode
         kwargs['mode_configuration'] = mode_configuration
 
-        success = self.client.configuration_request(**kwargs)         
+        success = self._configure(**kwargs)
         self.configured = success
         return success
     
-    def write(self, data, start_main=True, stop_main=True):
+    def write(self, data, start_main=True, stop_main=True, wait=True):
         """Write raw data to LED device
         
+        The START/STOP flags travel in the same request as the data, so a
+        complete update (APA102 start frame, LED frames, end frame) is a
+        single USB write. The device generates the start and end frames,
+        so don't include them in data.
+        
         Args:
             data (bytes or list): Raw data to write to LEDs
             start_main (bool): Send START condition before write (default: True)
@@ -93,9 +159,13 @@ class BPIOLED(BPIOBase):
             stop_main (bool): Send STOP condition after write (default: True)
                              For WS2812/ONBOARD: Finalizes reset pulse
                              For APA102: Sends end frame
+            wait (bool): Wait for the device to acknowledge (default: True)
+                         If False, return as soon as the frame is sent so the
+                         next frame can be prepared while this one goes out
             
         Returns:
             dict: Response from device, None if error
+                  (True once sent if wait=False)
         """
         if not self.config_check():
             return None
@@ -103,7 +173,8 @@ class BPIOLED(BPIOBase):
         return self.client.data_request(
             start_main=start_main,
             data_write=data,
-            stop_main=stop_main
+            stop_main=stop_main,
+            await_response=wait
         )
     
     def set_rgb(self, r, g, b, brightness=31, start_main=True, stop_main=True):
@@ -127,26 +198,40 @@ class BPIOLED(BPIOBase):
         if not self.config_check():
             return None
         
-        # WS2812 and onboard use GRB order, APA102 uses RGB with brightness
+        if self._stride is None:
+            print("LED type not configured")
+            return None
+        
         # Reset (WS2812/onboard)/START FRAME (APA102) is handled by 
         # setting the start_main and stop_main flags in the write() method
-        if self.led_type == self.LED_WS2812: 
-            # WS2812 format: GRB (brightness ignored)
-            data = bytes([g, r, b])
-        elif self.led_type == self.LED_ONBOARD:
-            # Onboard RGB format: RGB (brightness ignored)
-            data = bytes([r, g, b])
-        elif self.led_type == self.LED_APA102:
-            # APA102 format: BRG with brightness byte
-            # Brightness: 3 MSB = 111, 5 LSB = brightness (0-31)
-            brightness_byte = 0xE0 | (brightness & 0x1F)
-            data = bytes([brightness_byte, b, g, r])
+        color = (r, g, b)
+        p0, p1, p2 = self._perm
+        if self._pfx is None:
+            data = bytes((color[p0], color[p1], color[p2]))
         else:
-            print("LED type not configured")
-            return None
+            # Brightness: 5 LSB = brightness (0-31)
+            data = bytes((self._pfx | (brightness & 0x1F), color[p0], color[p1], color[p2]))
             
         return self.write(data, start_main=start_main, stop_main=stop_main)
  
+    def set_rgb_bytes(self, data, start_main=True, stop_main=True, wait=True):
+        """Set LEDs from a frame that is already in the LED's byte order
+        
+        Skips the color reordering of set_rgb(), for animations that build
+        their frames once and replay them: GRB for WS2812, RGB for ONBOARD,
+        brightness byte + BGR for APA102.
+        
+        Args:
+            data (bytes): Frame bytes for one or more LEDs
+            start_main (bool): Send START condition (default: True)
+            stop_main (bool): Send STOP condition (default: True)
+            wait (bool): Wait for the device to acknowledge (default: True)
+            
+        Returns:
+            dict: Response from device, None if error
+        """
+        return self.write(data, start_main=start_main, stop_main=stop_main, wait=wait)
+
     def set_rgbw(self, r, g, b, w, brightness=31, start_main=True, stop_main=True):
         """Set a single RGBW LED (WS2812 only)
         
@@ -177,7 +262,9 @@ class BPIOLED(BPIOBase):
         """Set multiple LEDs with RGB values
         
         Args:
-            colors (list of tuples): List of (r, g, b) tuples, one per LED
+            colors (list of tuples or bytes-like): List of (r, g, b) tuples, one per LED,
+                or a flat r, g, b, r, g, b, ... buffer (bytes, bytearray, memoryview,
+                or a NumPy uint8 array of shape (N, 3) or (3N,))
             brightness (int): Brightness 0-31 for APA102 (default: 31 = max, ignored for others)
             start_main (bool): Send START condition (default: True)
             stop_main (bool): Send STOP condition (default: True)
@@ -188,23 +275,118 @@ class BPIOLED(BPIOBase):
         if not self.config_check():
             return None
         
-        if self.led_type == self.LED_WS2812 or self.led_type == self.LED_ONBOARD:
-            # WS2812 format: GRB per LED (brightness ignored)
-            data = bytearray()
-            for r, g, b in colors:
-                data.extend([g, r, b])
-        elif self.led_type == self.LED_APA102:
-            # APA102 format: LED frames with brightness
-            # Brightness: 3 MSB = 111, 5 LSB = brightness (0-31)
-            brightness_byte = 0xE0 | (brightness & 0x1F)
-            data = bytearray()
-            for r, g, b in colors:
-                data.extend([brightness_byte, b, g, r])
-        else:
+        if self._stride is None:
             print("LED type not configured")
             return None
-            
-        return self.write(data, start_main=start_main, stop_main=stop_main)
+
+        if isinstance(colors, (bytes, bytearray, memoryview)):
+            if len(colors) % 3:
+                print(f"Color buffer length {len(colors)} is not a multiple of 3 (r, g, b)")
+                return None
+            if np is None:
+                return self.write(self._pack_flat(colors, brightness),
+                                  start_main=start_main, stop_main=stop_main)
+
+        if np is not None:
+            return self.write(self._pack_numpy(colors, brightness),
+                              start_main=start_main, stop_main=stop_main)
+
+        stride = self._stride
+        num_leds = len(colors)
+        if 0 < num_leds <= _MAX_UNROLL_LEDS:
+            need = num_leds * stride
+            if len(self._frame_buf) < need:
+                self._frame_buf = bytearray(need)
+            prefix = None if self._pfx is None else self._pfx | (brightness & 0x1F)
+            self._get_packer(num_leds)(colors, self._frame_buf, prefix)
+            data = bytes(memoryview(self._frame_buf)[:need])
+            return self.write(data, start_main=start_main, stop_main=stop_main)
+
+        # Long strips: build the frame with one bytes() over a flat iterator
+        p0, p1, p2 = self._perm
+        if self._pfx is None:
+            frame = chain.from_iterable((c[p0], c[p1], c[p2]) for c in colors)
+        else:
+            # APA102: brightness byte before each LED's colors
+            bb = self._pfx | (brightness & 0x1F)
+            frame = chain.from_iterable((bb, c[p0], c[p1], c[p2]) for c in colors)
+
+        return self.write(bytes(frame), start_main=start_main, stop_main=stop_main)
+
+    def _get_packer(self, num_leds):
+        """Internal: Get the generated packer for this layout and strip length"""
+        has_prefix = self._pfx is not None
+        key = (self._perm, num_leds, has_prefix)
+        packer = self._packer_cache.get(key)
+        if packer is None:
+            if len(self._packer_cache) >= _PACKER_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._packer_cache[next(iter(self._packer_cache))]
+            packer = _build_packer(num_leds, self._perm, has_prefix)
+            self._packer_cache[key] = packer
+        return packer
+
+    def _apa102_scaffold(self, num_leds, brightness):
+        """Internal: Get the APA102 frame buffer with brightness bytes prefilled"""
+        scaffold = self._apa_scaffold
+        if (brightness != self._apa_prev_brightness or scaffold is None
+                or len(scaffold) != num_leds * 4):
+            # Brightness: 5 LSB = brightness (0-31)
+            brightness_byte = self._pfx | (brightness & 0x1F)
+            scaffold = bytearray(bytes([brightness_byte, 0, 0, 0]) * num_leds)
+            self._apa_scaffold = scaffold
+            self._apa_prev_brightness = brightness
+        return scaffold
+
+    def _pack_flat(self, raw, brightness):
+        """Internal: Reorder a flat r, g, b buffer into an LED frame without NumPy"""
+        src = bytes(raw)
+        num_leds = len(src) // 3
+        p0, p1, p2 = self._perm
+        if self._pfx is None:
+            frame = bytearray(len(src))
+            offset = 0
+        else:
+            frame = bytearray(self._apa102_scaffold(num_leds, brightness))
+            offset = 1
+        # Strided slice copies move each channel in one C-level operation
+        stride = self._stride
+        frame[offset::stride] = src[p0::3]
+        frame[offset + 1::stride] = src[p1::3]
+        frame[offset + 2::stride] = src[p2::3]
+        return bytes(frame)
+
+    def _pack_numpy(self, colors, brightness):
+        """Internal: Reorder (r, g, b) colors into an LED frame with NumPy"""
+        if isinstance(colors, (bytes, bytearray, memoryview)):
+            # Zero copy view of the caller's buffer
+            arr = np.frombuffer(colors, dtype=np.uint8).reshape(-1, 3)
+        else:
+            arr = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+        if _led_pack.HAVE_NUMBA and len(arr) >= _led_pack.MIN_LEDS:
+            return self._pack_compiled(arr, brightness)
+
+        if self._pfx is None:
+            return arr[:, self._perm].tobytes()
+
+        # APA102: brightness byte already in place, fill in the color bytes
+        scaffold = self._apa102_scaffold(len(arr), brightness)
+        frame = np.frombuffer(scaffold, dtype=np.uint8).reshape(-1, 4)
+        frame[:, 1:] = arr[:, self._perm]
+        return bytes(scaffold)
+
+    def _pack_compiled(self, arr, brightness):
+        """Internal: Pack an (N, 3) uint8 color array with the Numba kernel"""
+        need = len(arr) * self._stride
+        if self._frame_out is None or len(self._frame_out) < need:
+            self._frame_out = np.empty(need, dtype=np.uint8)
+        out = self._frame_out[:need]
+
+        # A negative prefix tells the kernel there is no brightness byte
+        prefix = -1 if self._pfx is None else self._pfx | (brightness & 0x1F)
+        p0, p1, p2 = self._perm
+        _led_pack.pack_frame(arr, out, p0, p1, p2, prefix)
+        return out.tobytes()
     
     def clear(self, num_leds=1):
         """Turn off LEDs (set to black)
@@ -215,5 +397,18 @@ class BPIOLED(BPIOBase):
         Returns:
             dict: Response from device, None if error
         """
-        colors = [(0, 0, 0)] * num_leds
-        return self.set_multiple_rgb(colors, brightness=0, start_main=True, stop_main=True)
+        if not self.config_check():
+            return None
+
+        if self._stride is None:
+            print("LED type not configured")
+            return None
+
+        # All channels are zero, so skip the color loop and send the frame directly
+        if self._pfx is None:
+            data = bytes(num_leds * self._stride)
+        else:
+            # APA102: brightness 0 byte followed by zero BGR
+            data = bytes([self._pfx, 0, 0, 0]) * num_leds
+
+        return self.write(data, start_main=True, stop_main=True)
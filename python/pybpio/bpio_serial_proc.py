@@ -0,0 +1,113 @@
+"""
+BPIO Serial Worker Process
+
+Runs the serial port in a separate process so that sustained high speed
+reads keep up even when the main interpreter is busy (GIL contention with
+user code, stdout, callbacks). Raw chunks read from the port are pushed to
+a multiprocessing queue which the BPIOClient router thread drains and frames
+as usual. Writes are posted to a command queue consumed by the same process.
+
+Usage:
+    from pybpio.bpio_client import BPIOClient
+
+    # Enable the worker process instead of opening the port in-process
+    client = BPIOClient('COM3', serial_process=True)
+
+Note: on platforms that spawn processes (Windows, macOS) the calling script
+needs the usual `if __name__ == '__main__':` guard.
+"""
+
+import multiprocessing as mp
+import queue
+import threading
+
+import serial
+
+def enable_low_latency(ser):
+    """Ask the driver to deliver received bytes immediately (Linux only)
+
+    Sets ASYNC_LOW_LATENCY through pyserial, which turns off the latency
+    timer of USB serial adapters such as FTDI (16 ms by default). Drivers
+    that don't support it are left as they are. Returns True if set.
+    """
+    if not hasattr(ser, 'set_low_latency_mode'):
+        return False
+    try:
+        ser.set_low_latency_mode(True)
+        return True
+    except (IOError, OSError, ValueError):
+        return False
+
+class SerialWorker(mp.Process):
+    def __init__(self, port, baudrate, timeout=0.1):
+        super().__init__(daemon=True)
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.rx_queue = mp.Queue()      # Raw chunks read from the port
+        self.tx_queue = mp.Queue()      # Packets to write to the port
+        self._status_queue = mp.Queue() # Open result: None or error string
+        self._stop_event = mp.Event()
+
+    def run(self):
+        """Worker process: own the serial port, read into rx_queue, write from tx_queue"""
+        try:
+            ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+        except Exception as e:
+            self._status_queue.put(str(e))
+            return
+        enable_low_latency(ser)
+        self._status_queue.put(None)
+
+        writer = threading.Thread(target=self._writer_loop, args=(ser,), daemon=True)
+        writer.start()
+
+        try:
+            while not self._stop_event.is_set():
+                # Returns as soon as any data is available, or after timeout
+                chunk = ser.read(ser.in_waiting or 1)
+                if chunk:
+                    self.rx_queue.put(chunk)
+        except Exception as e:
+            self._status_queue.put(str(e))
+        finally:
+            self._stop_event.set()
+            writer.join(timeout=1.0)
+            ser.close()
+
+    def _writer_loop(self, ser):
+        """Worker process: write queued packets until stopped"""
+        while not self._stop_event.is_set():
+            try:
+                data = self.tx_queue.get(timeout=self.timeout)
+            except queue.Empty:
+                continue
+            ser.write(data)
+
+    def wait_ready(self, timeout):
+        """Wait for the port to open. Returns None on success or the error string"""
+        try:
+            return self._status_queue.get(timeout=timeout)
+        except queue.Empty:
+            return "Timeout waiting for serial worker to start"
+
+    def read_chunk(self, timeout):
+        """Get the next raw chunk read from the port, or b'' on timeout"""
+        try:
+            return self.rx_queue.get(timeout=timeout)
+        except queue.Empty:
+            return b''
+
+    def is_running(self):
+        """True while the worker process owns an open port"""
+        return self.is_alive() and not self._stop_event.is_set()
+
+    def write(self, data):
+        """Post data to be written by the worker process"""
+        self.tx_queue.put(bytes(data))
+
+    def stop(self):
+        """Stop the worker process and close the port"""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=1.0)
@@ -5,7 +5,11 @@ class BPIOSPI(BPIOBase):
         super().__init__(client)
     
     def configure(self, speed=1000000, clock_polarity=False, clock_phase=False, chip_select_idle=True, **kwargs):
-        """Configure SPI mode"""
+        """Configure SPI mode
+
+        An identical repeat of the last configure() is skipped (no request is
+        sent); pass force=True to send it anyway.
+        """
         kwargs['mode'] = 'SPI'
         # Get the existing mode_configuration from kwargs or create a new one
         mode_configuration = kwargs.get('mode_configuration', {})
@@ -17,7 +21,7 @@ class BPIOSPI(BPIOBase):
         # Replace the mode_configuration in kwargs
         kwargs['mode_configuration'] = mode_configuration
 
-        success = self.client.configuration_request(**kwargs)         
+        success = self._configure(**kwargs)
         self.configured = success
         return success
        
@@ -70,6 +74,39 @@ class BPIOSPI(BPIOBase):
             stop_main=True
         )
 
+    def transfer_into(self, write_data, buf, read_bytes=None):
+        """Perform SPI transfer, reading into a caller provided buffer
+
+        Lets repeated reads (e.g. flash pages) reuse one bytearray instead
+        of allocating a new bytes object per transfer.
+
+        Args:
+            write_data (bytes or list): Data to write, e.g. command and address
+            buf (bytearray or memoryview): Writable buffer for the data read
+            read_bytes (int): Number of bytes to read, defaults to len(buf)
+
+        Returns:
+            int: Number of bytes read into buf, None if error
+        """
+        if not self.configured:
+            print("SPI not configured. Call configure() first.")
+            return None
+
+        mv = memoryview(buf)
+        if read_bytes is None:
+            read_bytes = len(mv)
+
+        n = self.client.data_request(
+            start_main=True,
+            data_write=write_data,
+            bytes_read=read_bytes,
+            stop_main=True,
+            out=mv
+        )
+        if n is False:
+            return None
+        return n
+
     def transfer_duplex(self, write_data, read_bytes=None):
         """Perform Full Duplex SPI transfer"""
         if not self.configured:
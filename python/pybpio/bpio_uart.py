@@ -23,24 +23,39 @@ Usage:
     response = uart.read(10)
     
     # Monitor for asynchronous data
-    async_data = uart.get_async_data()
+    async_data = uart.read_async()
     
     client.close()
 """
 
 from .bpio_base import BPIOBase
+from ._bufpool import BufferPool
+from collections import deque
+from contextlib import contextmanager
+import logging
 import threading
-import time
+
+_log = logging.getLogger(__name__)
+
+# Async chunks kept for read_async(); the oldest are dropped once it is full
+ASYNC_BUFFER_CHUNKS = 1024
 
 class BPIOUART(BPIOBase):
     def __init__(self, client):
         super().__init__(client)
-        self._async_buffer = []
-        self._async_lock = threading.Lock()
-        self._monitoring = False
+        # Written only by the monitor thread and drained by read_async(). No
+        # lock: deque append/popleft/clear/copy are atomic, and the buffer
+        # object is only replaced by configure() while monitoring is stopped.
+        self._async_buffer = deque(maxlen=ASYNC_BUFFER_CHUNKS)
+        self._async_callback = None  # Set by configure() / start_async_monitoring()
+        self._monitor_thread = None
+        self._monitor_ready = threading.Event()  # Set once the monitor thread is running
+        self._monitor_stop = threading.Event()   # Set to ask the monitor thread to exit
+        self._buf_pool = BufferPool()  # Buffers lent out by read_into_pool()
         
     def configure(self, speed=115200, data_bits=8, parity=False, stop_bits=1, 
-                  flow_control=False, signal_inversion=False, async_callback=None, **kwargs):
+                  flow_control=False, signal_inversion=False, async_callback=None,
+                  async_buffer_depth=ASYNC_BUFFER_CHUNKS, **kwargs):
         """Configure UART mode
         
         Args:
@@ -52,7 +67,11 @@ class BPIOUART(BPIOBase):
             signal_inversion (bool): Invert UART signals (default: False)
             async_callback (function): Optional callback for async data: callback(data_bytes)
                                       If provided, async data goes to callback instead of buffer
-            **kwargs: Additional configuration parameters
+            async_buffer_depth (int): Async packets kept for read_async() before the oldest
+                                      are dropped (default: ASYNC_BUFFER_CHUNKS = 1024)
+            **kwargs: Additional configuration parameters. force=True sends the
+                      configuration even if it repeats the last one, which is
+                      otherwise skipped without a request
             
         Returns:
             bool: True if configuration successful, False otherwise
@@ -73,14 +92,12 @@ class BPIOUART(BPIOBase):
         # Replace the mode_configuration in kwargs
         kwargs['mode_configuration'] = mode_configuration
 
-        success = self.client.configuration_request(**kwargs)         
+        success = self._configure(**kwargs)
         self.configured = success
         
         # If monitoring is already running, stop it first to reconfigure
-        if self._monitoring:
+        if self._monitor_thread is not None:
             self._stop_async_monitoring()
-            # Small delay to ensure thread has fully stopped
-            time.sleep(0.1)
         
         # Clear any pending async data in the client's queue
         self.client.clear_async_queue()
@@ -89,14 +106,16 @@ class BPIOUART(BPIOBase):
         self._async_callback = async_callback
         
         # Clear any buffered data when reconfiguring
-        with self._async_lock:
+        if self._async_buffer.maxlen != async_buffer_depth:
+            self._async_buffer = deque(maxlen=async_buffer_depth)
+        else:
             self._async_buffer.clear()
         
         # Automatically start async monitoring when UART is configured
         if success:
+            # Bound once for the write/read fast path
+            self._request = self.client.data_request_fast
             self._start_async_monitoring()
-            # Small delay to ensure monitoring thread is ready
-            time.sleep(0.05)
         
         return success
     
@@ -109,10 +128,11 @@ class BPIOUART(BPIOBase):
         Returns:
             dict: Response from device, None if error
         """
-        if not self.config_check():
+        # config_check() only runs (and prints) when not configured
+        if not self.configured and not self.config_check():
             return None
             
-        return self.client.data_request(data_write=data)
+        return self._request(data)
     
     def read(self, num_bytes):
         """Read bytes from UART
@@ -123,10 +143,62 @@ class BPIOUART(BPIOBase):
         Returns:
             dict: Response containing read data, None if error
         """
+        if not self.configured and not self.config_check():
+            return None
+            
+        return self._request(None, num_bytes)
+
+    def read_into(self, buf, num_bytes):
+        """Read bytes from UART into a caller provided buffer
+        
+        Lets hot read loops reuse one bytearray instead of allocating a new
+        bytes object per read.
+        
+        Args:
+            buf (bytearray or memoryview): Writable buffer, at least num_bytes long
+            num_bytes (int): Number of bytes to read
+            
+        Returns:
+            int: Number of bytes read into buf, None if error
+        """
         if not self.config_check():
             return None
+        
+        n = self.client.data_request(bytes_read=num_bytes, out=buf)
+        if n is False:
+            return None
+        return n
+
+    @contextmanager
+    def read_into_pool(self, num_bytes):
+        """Read bytes from UART into a buffer borrowed from a pool
+        
+        The buffer goes back to the pool when the with block exits, so
+        repeated reads don't allocate. Don't keep the view after the block.
+        
+            with uart.read_into_pool(64) as data:
+                if data:
+                    process(data)
+        
+        Args:
+            num_bytes (int): Number of bytes to read
             
-        return self.client.data_request(bytes_read=num_bytes)
+        Yields:
+            memoryview: View of the bytes read (may be empty), None if error
+        """
+        buf = self._buf_pool.get_buffer(num_bytes)
+        view = memoryview(buf)
+        data = None
+        try:
+            n = self.read_into(view, num_bytes)
+            if n is not None:
+                data = view[:n]
+            yield data
+        finally:
+            if data is not None:
+                data.release()
+            view.release()
+            self._buf_pool.return_buffer(buf)
         
     def transfer(self, write_data, read_bytes=None):
         """Perform UART write followed by read
@@ -142,10 +214,32 @@ class BPIOUART(BPIOBase):
             print("UART not configured. Call configure() first.")
             return None
             
-        return self.client.data_request(
-            data_write=write_data,
-            bytes_read=read_bytes
-        )
+        return self._request(write_data, read_bytes)
+    
+    def transfer_batch(self, ops):
+        """Perform several UART writes/reads in one USB round trip
+        
+        The requests are pipelined by the client: written in one go and the
+        responses read back in order, instead of a round trip per write.
+        
+        Args:
+            ops: list of dicts with optional 'write_data' and 'read_bytes' keys,
+                 each one a transfer()
+            
+        Returns:
+            List with one transfer() result per op, or None on error
+        """
+        if not self.configured and not self.config_check():
+            return None
+        
+        requests = [{
+            'data_write': op.get('write_data'),
+            'bytes_read': op.get('read_bytes', 0),
+        } for op in ops]
+        results = self.client.data_request_batch(requests)
+        if results is False:
+            return None
+        return results
     
     def read_async(self, clear_buffer=True):
         """Read any accumulated asynchronous data from the buffer.
@@ -156,6 +250,8 @@ class BPIOUART(BPIOBase):
         
         Note: If an async_callback was provided to configure(), data goes directly
         to the callback and is not buffered. This method only returns buffered data.
+        The buffer holds the last async_buffer_depth async packets (see configure());
+        if it is not read often enough the oldest data is dropped.
         
         Args:
             clear_buffer (bool): If True, clear the buffer after reading (default: True)
@@ -164,68 +260,108 @@ class BPIOUART(BPIOBase):
         Returns:
             bytes: Concatenated async data received, or empty bytes if none available
         """
-        with self._async_lock:
-            if not self._async_buffer:
-                return b''
-            
-            # Concatenate all buffered chunks into single bytes object
-            result = b''.join(self._async_buffer)
-            
-            if clear_buffer:
-                self._async_buffer.clear()
-            
-            return result
+        buffer = self._async_buffer
+        if not clear_buffer:
+            return b''.join(buffer.copy())
+        
+        # Drain chunk by chunk so data appended meanwhile is kept for next time
+        chunks = []
+        try:
+            while True:
+                chunks.append(buffer.popleft())
+        except IndexError:
+            pass
+        
+        # Concatenate all buffered chunks into single bytes object
+        return b''.join(chunks)
     
+    def start_async_monitoring(self, callback=None):
+        """Start (or restart) async monitoring, optionally with a new callback.
+
+        configure() already starts monitoring, so this is only needed after
+        stop_async_monitoring() or to swap the callback without reconfiguring.
+
+        Args:
+            callback (function): Optional callback for async data: callback(data_bytes)
+                                If None, async data is buffered for read_async()
+        """
+        if not self.config_check():
+            return False
+        self._stop_async_monitoring()
+        self._async_callback = callback
+        self._start_async_monitoring()
+        return True
+
+    def stop_async_monitoring(self):
+        """Stop async monitoring. Buffered data remains available to read_async()."""
+        self._stop_async_monitoring()
+
     def _start_async_monitoring(self):
         """Internal: Start monitoring for asynchronous UART data"""
-        if self._monitoring:
+        if self._monitor_thread is not None and self._monitor_thread.is_alive():
             return
-            
-        self._monitoring = True
         
-        # Start monitoring thread
+        # Start monitoring thread and wait until it is actually running
+        self._monitor_stop.clear()
+        self._monitor_ready.clear()
         self._monitor_thread = threading.Thread(target=self._async_monitor_loop)
         self._monitor_thread.daemon = True
         self._monitor_thread.start()
+        self._monitor_ready.wait(timeout=1.0)
     
     def _stop_async_monitoring(self):
         """Internal: Stop monitoring for asynchronous UART data"""
-        self._monitoring = False
-        if hasattr(self, '_monitor_thread'):
-            self._monitor_thread.join(timeout=1.0)
+        if self._monitor_thread is None:
+            return
+        self._monitor_stop.set()
+        # Wake the thread from its wait on the async queue so it exits now
+        self.client.interrupt_async_wait()
+        self._monitor_thread.join(timeout=1.0)
+        self._monitor_thread = None
     
     def _async_monitor_loop(self):
         """Internal monitoring loop for async data"""
-        while self._monitoring and self.configured:
+        # The callback and buffer only change while monitoring is stopped, so
+        # look them up once instead of on every packet
+        check_async_data = self.client.check_async_data
+        callback = self._async_callback
+        buffer_extend = self._async_buffer.extend
+        
+        self._monitor_ready.set()
+        stop_requested = self._monitor_stop.is_set
+        while not stop_requested() and self.configured:
             try:
-                # Check for async data using a very short timeout
-                async_data = self.client.check_async_data(timeout=0.1)
+                # Block on the client's async queue; the wait releases the GIL
+                # and returns as soon as a packet arrives, or when
+                # _stop_async_monitoring() interrupts it
+                async_data = check_async_data(timeout=0.5, copy=False)
                 
-                if async_data and async_data.get('is_async', False):
-                    data_read = async_data.get('data_read', [])
-                    
-                    if data_read:
-                        data_bytes = bytes(data_read)
-                        
-                        # If callback is provided, call it; otherwise buffer the data
-                        if hasattr(self, '_async_callback') and self._async_callback:
-                            try:
-                                self._async_callback(data_bytes)
-                            except Exception as e:
-                                print(f"Async callback error: {e}")
-                        else:
-                            # No callback - accumulate in buffer for read_async()
-                            with self._async_lock:
-                                self._async_buffer.append(data_bytes)
+                # Then take everything else already queued without blocking,
+                # so a burst is handed over in one go
+                batch = []
+                while async_data:
+                    # A view into the received packet, not yet copied
+                    if async_data['is_async'] and async_data['data_read']:
+                        batch.append(async_data['data_read'])
+                    async_data = check_async_data(copy=False)
                 
-                # Small delay to prevent excessive CPU usage
-                time.sleep(0.01)
+                if batch:
+                    # If callback is provided, call it; otherwise buffer the data
+                    if callback is not None:
+                        try:
+                            callback(b''.join(batch))
+                        except Exception:
+                            _log.exception("Async callback error")
+                    else:
+                        # No callback - buffer the views, read_async() does
+                        # the one copy when it joins the chunks
+                        buffer_extend(batch)
                 
             except Exception as e:
-                print(f"Async monitoring error: {e}")
+                _log.warning("Async monitoring error: %s", e)
                 break
     
     def __del__(self):
         """Cleanup when object is destroyed"""
-        if hasattr(self, '_monitoring') and self._monitoring:
+        if getattr(self, '_monitor_thread', None) is not None:
             self._stop_async_monitoring()
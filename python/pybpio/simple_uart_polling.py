@@ -14,6 +14,7 @@ Example:
     python simple_uart_polling.py /dev/ttyUSB0
 """
 
+import logging
 import sys
 import time
 
@@ -29,6 +30,12 @@ except ImportError:
     print("Download from: https://github.com/DangerousPrototypes/BusPirate-BPIO2-flatbuffer-interface")
     sys.exit(1)
 
+# Per-packet output goes through logging so it costs a level check when quiet
+_log = logging.getLogger(__name__)
+
+# Bytes shown as text; any other byte in a chunk switches it to hex
+_PRINTABLE = bytes(range(0x20, 0x7F)) + b'\r\n\t'
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python simple_uart_polling.py <port>")
@@ -36,6 +43,8 @@ def main():
         sys.exit(1)
     
     port = sys.argv[1]
+    # Received data goes to stdout with the rest of the output
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     
     try:
         # Connect and configure
@@ -62,17 +71,15 @@ def main():
             # This is the key new feature - async data detection!
             async_response = client.check_async_data(timeout=0.1)
             
-            if async_response and async_response.get('is_async', False):
-                data = async_response.get('data_read', [])
-                if data:
-                    received = bytes(data)
-                    try:
-                        # Try to decode as text
-                        text = received.decode('utf-8', errors='ignore')
-                        print(f"Async RX: '{text.strip()}' ({len(received)} bytes)")
-                    except:
-                        # Fall back to hex
-                        print(f"Async RX: {received.hex()} ({len(received)} bytes)")
+            # Both keys are always present in a check_async_data() result
+            received = async_response['data_read'] if async_response else None
+            if received and async_response['is_async']:
+                # Text if every byte is printable (nothing left after
+                # deleting the printable ones), hex otherwise
+                if not received.translate(None, _PRINTABLE):
+                    _log.info("Async RX: '%s' (%d bytes)", received.decode('ascii').strip(), len(received))
+                else:
+                    _log.info("Async RX: %s (%d bytes)", received.hex(), len(received))
             
             # Small delay to prevent excessive polling
             time.sleep(0.05)
@@ -1,6 +1,8 @@
 import sys
 import os
+import struct
 import flatbuffers
+import numpy as np
 
 # Ensure repo root is on path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
@@ -11,34 +13,71 @@ import tooling.bpio.ResponsePacket as ResponsePacket
 import tooling.bpio.ResponsePacketContents as ResponsePacketContents
 
 
+# One Builder reused for every response; Clear() resets it without
+# reallocating its buffer
+_builder = flatbuffers.Builder(4096)
+
+# Generated table helpers, looked up once
+_status_start = StatusResponse.StatusResponseStart
+_status_end = StatusResponse.StatusResponseEnd
+_add_fb_major = StatusResponse.StatusResponseAddVersionFlatbuffersMajor
+_add_fb_minor = StatusResponse.StatusResponseAddVersionFlatbuffersMinor
+_add_fw_major = StatusResponse.StatusResponseAddVersionFirmwareMajor
+_add_fw_minor = StatusResponse.StatusResponseAddVersionFirmwareMinor
+_add_git_hash = StatusResponse.StatusResponseAddVersionFirmwareGitHash
+_add_fw_date = StatusResponse.StatusResponseAddVersionFirmwareDate
+_add_modes = StatusResponse.StatusResponseAddModesAvailable
+_add_adc_mv = StatusResponse.StatusResponseAddAdcMv
+_add_mode_current = StatusResponse.StatusResponseAddModeCurrent
+
+
+def _create_offset_vector(b, start_vector, offsets):
+    """Write a vector of table/string offsets with one slice assignment
+
+    Same bytes as start_vector() followed by PrependUOffsetTRelative() for
+    each offset in reverse, without a Python call per element.
+    """
+    n = len(offsets)
+    start_vector(b, n)
+    # Each UOffsetT is stored relative to its own position in the buffer;
+    # element i ends up (n - i) * 4 bytes past the current offset
+    base = b.Offset()
+    rel = [base + (n - i) * 4 - off for i, off in enumerate(offsets)]
+    b.head -= n * 4
+    b.Bytes[b.head:b.head + n * 4] = struct.pack(f"<{n}I", *rel)
+    return b.EndVector()
+
+
 def build_fake_status_response():
-    b = flatbuffers.Builder(1024)
+    b = _builder
+    b.Clear()
 
     # Strings
     git_hash = b.CreateString("deadbeef")
     fw_date = b.CreateString("2026-01-30")
     mode_current = b.CreateString("testmode")
 
-    # modes_available vector
+    # modes_available vector (string offsets, packed in one go)
     mode1 = b.CreateString("mode1")
     mode2 = b.CreateString("mode2")
-    StatusResponse.StatusResponseStartModesAvailableVector(b, 2)
-    b.PrependUOffsetTRelative(mode2)
-    b.PrependUOffsetTRelative(mode1)
-    modes_vec = b.EndVector()
+    modes_vec = _create_offset_vector(
+        b, StatusResponse.StatusResponseStartModesAvailableVector, [mode1, mode2])
+
+    # ADC vector (numeric, so one memcpy from a uint32 array)
+    adc_vec = b.CreateNumpyVector(np.array([3300, 0, 1650, 5000], dtype=np.uint32))
 
-    # ADC vector (empty for this test)
     # Build the StatusResponse table
-    StatusResponse.StatusResponseStart(b)
-    StatusResponse.StatusResponseAddVersionFlatbuffersMajor(b, 2)
-    StatusResponse.StatusResponseAddVersionFlatbuffersMinor(b, 0)
-    StatusResponse.StatusResponseAddVersionFirmwareMajor(b, 1)
-    StatusResponse.StatusResponseAddVersionFirmwareMinor(b, 0)
-    StatusResponse.StatusResponseAddVersionFirmwareGitHash(b, git_hash)
-    StatusResponse.StatusResponseAddVersionFirmwareDate(b, fw_date)
-    StatusResponse.StatusResponseAddModesAvailable(b, modes_vec)
-    StatusResponse.StatusResponseAddModeCurrent(b, mode_current)
-    status_off = StatusResponse.StatusResponseEnd(b)
+    _status_start(b)
+    _add_fb_major(b, 2)
+    _add_fb_minor(b, 0)
+    _add_fw_major(b, 1)
+    _add_fw_minor(b, 0)
+    _add_git_hash(b, git_hash)
+    _add_fw_date(b, fw_date)
+    _add_modes(b, modes_vec)
+    _add_adc_mv(b, adc_vec)
+    _add_mode_current(b, mode_current)
+    status_off = _status_end(b)
 
     # Wrap in ResponsePacket union
     ResponsePacket.ResponsePacketStart(b)
@@ -46,6 +85,7 @@ def build_fake_status_response():
     ResponsePacket.ResponsePacketAddContents(b, status_off)
     resp_off = ResponsePacket.ResponsePacketEnd(b)
     b.Finish(resp_off)
+    # Copy out, the builder's buffer is reused by the next call
     return bytes(b.Output())
 
 
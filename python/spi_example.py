@@ -11,78 +11,68 @@ import sys
 from pybpio.bpio_client import BPIOClient
 from pybpio.bpio_spi import BPIOSPI
 
-def spi_read_jedec_id(client, speed=1000000):
-    """Read JEDEC ID from SPI flash memory."""
+# JEDEC manufacturer IDs of common SPI flash vendors
+_MANUFACTURERS = {
+    0xEF: "Winbond",
+    0xC2: "Macronix",
+    0x20: "Micron/ST",
+    0x01: "Spansion/Cypress",
+    0xBF: "SST/Microchip",
+    0x1F: "Atmel/Adesto",
+    0x85: "Puya"
+}
+
+def spi_setup(client, speed=1000000):
+    """Configure SPI for flash access. Returns the BPIOSPI instance or None."""
     spi = BPIOSPI(client)
     
-    if spi.configure(speed=speed, clock_polarity=False, clock_phase=False, 
-                    chip_select_idle=True, psu_enable=True, psu_set_mv=3300, 
-                    psu_set_ma=0, pullup_enable=True):
-        
-        print(f"SPI configured at {speed/1000000:.1f}MHz")
+    if not spi.configure(speed=speed, clock_polarity=False, clock_phase=False, 
+                         chip_select_idle=True, psu_enable=True, psu_set_mv=3300, 
+                         psu_set_ma=0, pullup_enable=True):
+        print("Failed to configure SPI interface")
+        return None
+    
+    print(f"SPI configured at {speed/1000000:.1f}MHz")
+    return spi
+
+def spi_read_jedec_id(spi):
+    """Read JEDEC ID from SPI flash memory."""
+    # Read JEDEC ID (0x9F command)
+    print("Reading SPI flash JEDEC ID...")
+    data = spi.transfer(write_data=[0x9F], read_bytes=3)
+    
+    if data and len(data) == 3:
+        manufacturer = data[0]
+        device_type = data[1]
+        capacity = data[2]
         
-        # Read JEDEC ID (0x9F command)
-        print("Reading SPI flash JEDEC ID...")
-        data = spi.transfer(write_data=[0x9F], read_bytes=3)
+        print(f"JEDEC ID: {data.hex().upper()}")
+        print(f"Manufacturer ID: 0x{manufacturer:02X}")
+        print(f"Device Type: 0x{device_type:02X}")
+        print(f"Capacity: 0x{capacity:02X}")
         
-        if data and len(data) == 3:
-            manufacturer = data[0]
-            device_type = data[1]
-            capacity = data[2]
-            
-            print(f"JEDEC ID: {data.hex().upper()}")
-            print(f"Manufacturer ID: 0x{manufacturer:02X}")
-            print(f"Device Type: 0x{device_type:02X}")
-            print(f"Capacity: 0x{capacity:02X}")
-            
-            # Decode common manufacturers
-            manufacturers = {
-                0xEF: "Winbond",
-                0xC2: "Macronix", 
-                0x20: "Micron/ST",
-                0x01: "Spansion/Cypress",
-                0xBF: "SST/Microchip",
-                0x1F: "Atmel/Adesto",
-                0x85: "Puya"
-            }
-            
-            if manufacturer in manufacturers:
-                print(f"Manufacturer: {manufacturers[manufacturer]}")
-            else:
-                print(f"Manufacturer: Unknown (0x{manufacturer:02X})")
-                
-        else:
-            print("Failed to read JEDEC ID")
-            return False
+        # Decode common manufacturers
+        name = _MANUFACTURERS.get(manufacturer, f"Unknown (0x{manufacturer:02X})")
+        print(f"Manufacturer: {name}")
+        return True
     else:
-        print("Failed to configure SPI interface")
+        print("Failed to read JEDEC ID")
         return False
-    
-    return True
 
-def spi_read_status(client, speed=1000000):
+def spi_read_status(spi):
     """Read status register from SPI flash."""
-    spi = BPIOSPI(client)
+    print("Reading SPI flash status register...")
+    data = spi.transfer(write_data=[0x05], read_bytes=1)
     
-    if spi.configure(speed=speed, clock_polarity=False, clock_phase=False,
-                    chip_select_idle=True, psu_enable=True, psu_set_mv=3300,
-                    psu_set_ma=0, pullup_enable=True):
-        
-        print("Reading SPI flash status register...")
-        data = spi.transfer(write_data=[0x05], read_bytes=1)
-        
-        if data and len(data) == 1:
-            status = data[0]
-            print(f"Status Register: 0x{status:02X} (0b{status:08b})")
-            print(f"  WIP (Write in Progress): {'Yes' if status & 0x01 else 'No'}")
-            print(f"  WEL (Write Enable Latch): {'Yes' if status & 0x02 else 'No'}")
-            print(f"  Block Protection bits: 0b{(status >> 2) & 0x07:03b}")
-            return True
-        else:
-            print("Failed to read status register")
-            return False
+    if data and len(data) == 1:
+        status = data[0]
+        print(f"Status Register: 0x{status:02X} (0b{status:08b})")
+        print(f"  WIP (Write in Progress): {'Yes' if status & 0x01 else 'No'}")
+        print(f"  WEL (Write Enable Latch): {'Yes' if status & 0x02 else 'No'}")
+        print(f"  Block Protection bits: 0b{(status >> 2) & 0x07:03b}")
+        return True
     else:
-        print("Failed to configure SPI interface")
+        print("Failed to read status register")
         return False
 
 def main():
@@ -110,10 +100,14 @@ Examples:
         client = BPIOClient(args.port)
         print(f"Connected to Bus Pirate on {args.port}")
         
-        if args.status:
-            success = spi_read_status(client, args.speed)
+        # One configured SPI instance serves every command
+        spi = spi_setup(client, args.speed)
+        if spi is None:
+            success = False
+        elif args.status:
+            success = spi_read_status(spi)
         else:
-            success = spi_read_jedec_id(client, args.speed)
+            success = spi_read_jedec_id(spi)
         
         client.close()
         return 0 if success else 1
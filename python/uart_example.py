@@ -1,97 +1,427 @@
+#!/usr/bin/env python3
+"""
+BPIO2 UART Example - Synchronous writes and asynchronous receive modes
+Demonstrates buffered and callback async data, a loopback test, an
+interactive terminal and a receive-only monitor, selected with --mode.
+"""
+
 import argparse
+import logging
+import os
 import sys
+import threading
 import time
+from collections import deque
+
+# pybpio (flatbuffers, numpy, pyserial) and asyncio are imported where they
+# are used, so --help and argument errors don't pay for loading them
+
+# Per-packet output goes through logging so it costs a level check when quiet
+_log = logging.getLogger(__name__)
+
+# On a terminal the async handler writes straight to the stdout file
+# descriptor, so the monitor thread doesn't take the sys.stdout or logging
+# locks per chunk. Redirected output is buffered, so there it writes to
+# sys.stdout.buffer to stay in order with print(). None when not a terminal.
+try:
+    _STDOUT_FD = sys.stdout.fileno() if sys.stdout.isatty() else None
+except (AttributeError, OSError):
+    _STDOUT_FD = None
+
+# Bytes shown as text; any other byte in a chunk switches it to hex
+_PRINTABLE = bytes(range(0x20, 0x7F)) + b'\r\n\t'
+
+# Loopback test message and its hex form, built once
+_TEST_MSG = b"Hello UART!\r\n"
+_TEST_MSG_HEX = _TEST_MSG.hex()
+
+# Shortest wait for loopback data; covers the USB round trips at any baud
+_MIN_RX_TIMEOUT = 0.5
+
+def _baud(value):
+    """argparse type for --speed: a positive baud rate"""
+    speed = int(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError(f"invalid baud rate {speed}, must be positive")
+    return speed
+
+def rx_timeout(args, num_bytes):
+    """Seconds to wait for num_bytes to loop back: 3x their time on the wire at args.speed"""
+    bits_per_byte = 1 + args.data_bits + (1 if args.parity else 0) + args.stop_bits
+    return max(_MIN_RX_TIMEOUT, num_bytes * bits_per_byte / args.speed * 3)
+
+def is_text(data):
+    """True if data only holds printable ASCII, CR, LF or tab"""
+    return not data.translate(None, _PRINTABLE)
+
+def send_messages(uart, msgs):
+    """Send several messages as one UART write (one request instead of one per message)."""
+    return uart.write(b"".join(msgs))
+
+def _configure(uart, args, async_callback=None):
+    """Configure UART from the command line options. Returns True on success."""
+    # One write for the whole block instead of a print() per line
+    sys.stdout.write("\n".join([
+        "Configuring UART:",
+        f"  Speed: {args.speed} baud",
+        f"  Data bits: {args.data_bits}",
+        f"  Parity: {'Even' if args.parity else 'None'}",
+        f"  Stop bits: {args.stop_bits}",
+        f"  Flow control: {'Yes' if args.flow_control else 'No'}",
+        f"  Signal inversion: {'Yes' if args.signal_inversion else 'No'}",
+        f"  PSU: {'3.3V' if args.psu else 'Off'}",
+    ]) + "\n\n")
+    # configure() starts async monitoring; get everything printed so far out
+    # before the handler can write
+    sys.stdout.flush()
+
+    psu = {'psu_enable': True, 'psu_set_mv': 3300, 'psu_set_ma': 0} if args.psu else {}
+    if not uart.configure(speed=args.speed, data_bits=args.data_bits,
+                          parity=args.parity, stop_bits=args.stop_bits,
+                          flow_control=args.flow_control,
+                          signal_inversion=args.signal_inversion,
+                          async_callback=async_callback, **psu):
+        print("Failed to configure UART interface")
+        return False
+
+    print(f"UART configured at {args.speed} baud\n")
+    return True
+
+def async_data_handler(data):
+    """Handle asynchronous UART data"""
+    if not _log.isEnabledFor(logging.INFO):
+        return
+    try:
+        # Show as text if every byte is printable, hex otherwise
+        if is_text(data):
+            line = b"Async RX: '%s' (%d bytes)\n" % (data.strip(), len(data))
+        else:
+            line = b"Async RX: %s (%d bytes)\n" % (data.hex().encode(), len(data))
+        if _STDOUT_FD is not None:
+            os.write(_STDOUT_FD, line)
+        elif hasattr(sys.stdout, 'buffer'):
+            sys.stdout.buffer.write(line)
+        else:
+            sys.stdout.write(line.decode('ascii'))
+    except Exception:
+        _log.exception("Error in async handler")
+
+def wait_for_rx(uart, n, timeout=1.0, send=None, callback=None):
+    """Wait until n bytes arrive on async RX, optionally sending data first
+
+    Temporarily collects async data with its own callback and wakes as soon
+    as n bytes are in, instead of sleeping for a fixed time. The callback
+    is set before sending so a fast reply can't be missed. Afterwards async
+    data goes to callback again (None = buffer for read_async()).
+
+    send may be bytes, or a list of messages which are all written in one
+    batch (one USB round trip).
+
+    Returns the bytes received (fewer than n on timeout), None if the
+    write failed.
+    """
+    received = bytearray()
+    done = threading.Event()
 
-# Import BPIO client and UART interface
-from pybpio.bpio_client import BPIOClient
-from pybpio.bpio_uart import BPIOUART
+    def collect(data):
+        received.extend(data)
+        if len(received) >= n:
+            done.set()
 
-def uart_buffered_mode(client, speed=115200):
+    uart.start_async_monitoring(callback=collect)
+    try:
+        if isinstance(send, list):
+            results = uart.transfer_batch([{'write_data': m} for m in send])
+            if results is None or False in results:
+                return None
+        elif send is not None and uart.write(send) is False:
+            return None
+        done.wait(timeout)
+    finally:
+        uart.start_async_monitoring(callback=callback)
+    return bytes(received)
+
+def uart_buffered_mode(uart, args):
     """UART example with buffered async data (read at leisure)."""
     print("=== UART Buffered Mode Example ===\n")
-    
-    uart = BPIOUART(client)
 
     # Configure UART without callback - data accumulates in buffer
-    print("Configuring UART interface (buffered mode)...\n")
-    if uart.configure(speed=speed, data_bits=8, parity=False, stop_bits=1, 
-                      psu_enable=True, psu_set_mv=3300, psu_set_ma=0):
+    if not _configure(uart, args):
+        return False
 
-        print(f"UART configured at {speed} baud\n")
-        
-        # Send test message
-        print("Sending test message...")
-        test_message = b"Hello UART!\r\n"
-        response = uart.write(test_message)
-        if response:
-            print(f"TX: {test_message.hex()} ({test_message})")
-        
-        # Wait for async loopback data to accumulate
-        print("Waiting for async loopback data (3 seconds)...\n")
-        time.sleep(3)
-        
-        # Read buffered async data at our leisure
-        async_data = uart.read_async()
-        if async_data:
-            print(f"Async RX (buffered): {async_data.hex()} ({async_data})")
+    # Send test message
+    print("Sending test message...")
+    response = send_messages(uart, [_TEST_MSG])
+    if response is not False:
+        print(f"TX: {_TEST_MSG_HEX} ({_TEST_MSG})")
+
+    # Collect buffered async data until the whole message is back
+    # (or the timeout passes), instead of always sleeping the full time
+    timeout = rx_timeout(args, len(_TEST_MSG))
+    print(f"Waiting for async loopback data (up to {timeout:.1f} seconds)...\n")
+    # Grow one bytearray in place rather than building a new bytes per poll.
+    # Poll quickly while data is flowing and back off (1 ms doubling to
+    # 50 ms) while it isn't.
+    async_data = bytearray()
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while time.monotonic() < deadline:
+        data = uart.read_async()
+        if data:
+            async_data += data
+            if len(async_data) >= len(_TEST_MSG):
+                break
+            delay = 0.001  # Reset on activity
         else:
-            print("No async data received")
-        
-        print("\nBuffered mode test complete.")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.050)
+
+    if async_data:
+        mv = memoryview(async_data)
+        print(f"Async RX (buffered): {mv.hex()} ({bytes(mv)})")
     else:
-        print("Failed to configure UART interface")
-        return False
-    
+        print("No async data received")
+
+    print("\nBuffered mode test complete.")
     return True
 
-def uart_callback_mode(client, speed=115200):
+def uart_callback_mode(uart, args):
     """UART example with callback for real-time async data processing."""
     print("=== UART Callback Mode Example ===\n")
-    
-    uart = BPIOUART(client)
-    
-    # Track received data
-    received_chunks = []
-    
+
+    # The callback runs on the monitor thread, so it only queues the chunk;
+    # formatting and printing happen here on the main thread. deque
+    # append/popleft are atomic, no lock needed. Unbounded, so every chunk
+    # counted in rx_count is also reported.
+    rx_q = deque()
+    rx_count = [0]
+    done = threading.Event()  # Set once the whole message has looped back
+
     def async_data_handler(data):
         """Callback function called when async data arrives"""
-        print(f"  Callback RX: {data.hex()} ({data})")
-        received_chunks.append(data)
-    
+        rx_q.append(data)
+        rx_count[0] += len(data)
+        if rx_count[0] >= len(_TEST_MSG):
+            done.set()
+
     # Configure UART with callback - data goes directly to handler
-    print("Configuring UART interface (callback mode)...\n")
-    if uart.configure(speed=speed, data_bits=8, parity=False, stop_bits=1,
-                      psu_enable=True, psu_set_mv=3300, psu_set_ma=0,
-                      async_callback=async_data_handler):
-        
-        print(f"UART configured at {speed} baud\n")
-        
-        # Send test message
+    if not _configure(uart, args, async_callback=async_data_handler):
+        return False
+
+    # Send test message
+    print("Sending test message...")
+    response = send_messages(uart, [_TEST_MSG])
+    if response is not False:
+        print(f"TX: {_TEST_MSG_HEX} ({_TEST_MSG})")
+
+    # Wait for async loopback data (handler called automatically),
+    # returning as soon as the handler has seen the whole message
+    print("\nWaiting for async loopback (callback will be called)...\n")
+    done.wait(timeout=rx_timeout(args, len(_TEST_MSG)))
+
+    # Drain the queued chunks into one bytearray. The report is collected
+    # in lines and written out in one go.
+    total_data = bytearray()
+    rx_chunks = 0
+    lines = []
+    while rx_q:
+        data = rx_q.popleft()
+        lines.append(f"  Callback RX: {data.hex()} ({data})")
+        total_data += data
+        rx_chunks += 1
+
+    # Show what was received via callback
+    if total_data:
+        lines.append(f"\nTotal received via callback: {total_data.hex()} ({bytes(total_data)})")
+        lines.append(f"Received in {rx_chunks} chunks")
+    else:
+        lines.append("\nNo async data received")
+
+    lines.append("\nCallback mode test complete.")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return True
+
+async def _uart_asyncio_example(uart, args):
+    """Internal: Send the test message and collect its loopback concurrently"""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    rx_q = asyncio.Queue()
+
+    def async_data_handler(data):
+        """Callback function called when async data arrives"""
+        # Runs on the monitor thread; hand the chunk to the event loop
+        loop.call_soon_threadsafe(rx_q.put_nowait, data)
+
+    # BPIOUART is blocking, so its calls run in the default thread pool
+    if not await loop.run_in_executor(None, _configure, uart, args, async_data_handler):
+        return False
+
+    received = bytearray()
+
+    async def tx_task():
         print("Sending test message...")
-        test_message = b"Hello UART!\r\n"
-        response = uart.write(test_message)
-        if response:
-            print(f"TX: {test_message.hex()} ({test_message})")
-        
-        # Wait for async loopback data (handler called automatically)
-        print("\nWaiting for async loopback (callback will be called)...\n")
-        time.sleep(3)
-        
-        # Show what was received via callback
-        if received_chunks:
-            total_data = b''.join(received_chunks)
-            print(f"\nTotal received via callback: {total_data.hex()} ({total_data})")
-            print(f"Received in {len(received_chunks)} chunks")
-        else:
-            print("\nNo async data received")
-        
-        print("\nCallback mode test complete.")
+        response = await loop.run_in_executor(None, send_messages, uart, [_TEST_MSG])
+        if response is not False:
+            print(f"TX: {_TEST_MSG_HEX} ({_TEST_MSG})")
+
+    async def rx_task():
+        while len(received) < len(_TEST_MSG):
+            data = await rx_q.get()
+            print(f"  Async RX: {data.hex()} ({data})")
+            received.extend(data)
+
+    # Finishes as soon as the whole message is back, or at the timeout
+    try:
+        await asyncio.wait_for(asyncio.gather(tx_task(), rx_task()),
+                               timeout=rx_timeout(args, len(_TEST_MSG)))
+    except asyncio.TimeoutError:
+        pass
+    # The callback needs this event loop, stop it before asyncio.run() closes it
+    await loop.run_in_executor(None, uart.stop_async_monitoring)
+
+    if received:
+        print(f"\nTotal received: {received.hex()} ({bytes(received)})")
     else:
-        print("Failed to configure UART interface")
+        print("\nNo async data received")
+
+    print("\nasyncio mode test complete.")
+    return True
+
+def uart_asyncio_mode(uart, args):
+    """UART example with asyncio tasks for TX and RX."""
+    import asyncio
+
+    print("=== UART asyncio Mode Example ===\n")
+    return asyncio.run(_uart_asyncio_example(uart, args))
+
+def loopback_test(uart, args):
+    """Perform loopback test"""
+    handler = None if args.no_async else async_data_handler
+    if not _configure(uart, args, async_callback=handler):
         return False
-    
+
+    print("=== LOOPBACK TEST ===")
+    print("Connect TX to RX for this test")
+    print("Press Ctrl+C to stop\n")
+
+    test_messages = [
+        b"Hello World!\r\n",
+        b"Test message 123\r\n",
+        b"UART BPIO Test\r\n",
+        b"\x01\x02\x03\x04\x05"  # Binary data
+    ]
+
+    try:
+        total = sum(len(m) for m in test_messages)
+        print(f"Sending {len(test_messages)} messages ({total} bytes) in one batch...")
+
+        # Send every message at once and wait for all of it to loop back
+        received = wait_for_rx(uart, total, timeout=rx_timeout(args, total),
+                               send=test_messages, callback=handler)
+        if received is None:
+            print("  ERROR: Write failed")
+            return False
+        if not received:
+            print("  ERROR: Read failed or no data")
+            return False
+
+        # The loopback data comes back in order, split it per message
+        passed = True
+        pos = 0
+        for i, message in enumerate(test_messages):
+            print(f"Test {i+1}: {len(message)} bytes")
+            rx = received[pos:pos + len(message)]
+            pos += len(message)
+
+            # Only build the hex strings when they will be shown
+            if _log.isEnabledFor(logging.INFO):
+                _log.info("  TX: %s (%s)", message, message.hex())
+                _log.info("  RX: %s (%s)", rx, rx.hex())
+
+            if rx == message:
+                print("  ✓ PASS: Data matches")
+            else:
+                print("  ✗ FAIL: Data mismatch")
+                passed = False
+        return passed
+
+    except KeyboardInterrupt:
+        print("\nLoopback test interrupted")
+        return False
+
+def interactive_test(uart, args):
+    """Interactive UART test"""
+    if not _configure(uart, args, async_callback=None if args.no_async else async_data_handler):
+        return False
+
+    print("=== INTERACTIVE TEST ===")
+    print("Type messages to send (empty line to quit)")
+    print("Async data will be displayed as received\n")
+
+    try:
+        while True:
+            try:
+                user_input = input("TX> ").strip()
+                if not user_input:
+                    break
+
+                # Add line ending if not present
+                message = user_input.encode('utf-8')
+                if not message.endswith(b'\r\n') and not message.endswith(b'\n'):
+                    message += b'\r\n'
+
+                # Send the message
+                response = uart.write(message)
+                if response is not False:
+                    print(f"Sent: {len(message)} bytes")
+                else:
+                    print("ERROR: Send failed")
+
+            except KeyboardInterrupt:
+                break
+            except EOFError:
+                break
+
+    except Exception as e:
+        print(f"Interactive test error: {e}")
+        return False
+    return True
+
+def monitor_only_test(uart, args):
+    """Just monitor for async data"""
+    if not _configure(uart, args, async_callback=None if args.no_async else async_data_handler):
+        return False
+
+    print("=== MONITORING MODE ===")
+    print("Listening for UART data...")
+    print("Press Ctrl+C to stop\n")
+
+    try:
+        if args.monitor_seconds:
+            time.sleep(args.monitor_seconds)
+        else:
+            while True:
+                time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    print("\nMonitoring stopped")
     return True
-        
+
+# --mode choices, all called as mode(uart, args)
+MODES = {
+    'callback': uart_callback_mode,
+    'buffered': uart_buffered_mode,
+    'asyncio': uart_asyncio_mode,
+    'loopback': loopback_test,
+    'interactive': interactive_test,
+    'monitor': monitor_only_test,
+}
+
+# Modes from the former pybpio/uart_example.py keep its defaults: the PSU
+# stays off unless --psu is given, and the device status is shown first
+_TEST_MODES = ('loopback', 'interactive', 'monitor')
 
 # Example usage and testing
 def main():
@@ -102,9 +432,14 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-    %(prog)s -p COM3                    # Run callback mode example (default)
-    %(prog)s -p COM3 --mode buffered    # Run buffered mode example
-    %(prog)s -p COM3 --speed 9600       # Use 9600 baud with callback mode
+    %(prog)s -p COM3                           # Run callback mode example (default)
+    %(prog)s -p COM3 --mode buffered           # Run buffered mode example
+    %(prog)s -p COM3 --mode asyncio            # Run asyncio mode example
+    %(prog)s -p COM3 --speed 9600              # Use 9600 baud with callback mode
+    %(prog)s -p COM3 --mode loopback           # Loopback test (connect TX to RX)
+    %(prog)s -p COM3 --mode interactive        # Type messages to send
+    %(prog)s -p COM3 --mode monitor --monitor-seconds 10  # Just monitor async data
+    %(prog)s -p COM3 --parity --stop-bits 2    # Different settings
 
 Async Modes:
     Callback Mode (default):
@@ -112,36 +447,82 @@ Async Modes:
         - Callback is called immediately when async data arrives
         - Good for real-time processing and event-driven applications
         - Data is NOT buffered when using callback mode
-        
+
     Buffered Mode:
         - Async data accumulates in an internal buffer
         - Read at your leisure with uart.read_async()
         - Good for polling-based applications
+
+    asyncio Mode:
+        - The callback hands data to an asyncio.Queue
+        - Blocking BPIO calls run in the event loop's thread pool
+        - Good for applications built around asyncio
 """
     )
     parser.add_argument('-p', '--port', required=True,
                        help='Serial port (e.g., COM3, /dev/ttyUSB0)')
-    parser.add_argument('--speed', type=int, default=115200,
+    parser.add_argument('--mode', choices=list(MODES), default='callback',
+                       help='Which example to run (default: callback)')
+    parser.add_argument('--speed', type=_baud, default=115200,
                        help='UART speed in bps (default: 115200)')
-    parser.add_argument('--mode', choices=['buffered', 'callback'], default='callback',
-                       help='Which mode to demonstrate (default: callback)')
-    
+    parser.add_argument('--data-bits', type=int, default=8, choices=[5,6,7,8],
+                       help='Data bits (default: 8)')
+    parser.add_argument('--parity', action='store_true',
+                       help='Enable even parity (default: no parity)')
+    parser.add_argument('--stop-bits', type=int, default=1, choices=[1,2],
+                       help='Stop bits (default: 1)')
+    parser.add_argument('--flow-control', action='store_true',
+                       help='Enable hardware flow control')
+    parser.add_argument('--signal-inversion', action='store_true',
+                       help='Invert UART signals')
+    parser.add_argument('--psu', dest='psu', action='store_true', default=None,
+                       help='Enable the 3.3V power supply (default for callback and buffered)')
+    parser.add_argument('--no-psu', dest='psu', action='store_false',
+                       help='Leave the power supply off (default for loopback, interactive and monitor)')
+    parser.add_argument('--monitor-seconds', type=float, default=0,
+                       help='Monitor mode run time, 0 = until Ctrl+C (default: 0)')
+    parser.add_argument('--no-async', action='store_true',
+                       help='Buffer async data instead of printing it (loopback, interactive, monitor)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                       help='Don\'t print each packet sent/received')
+
     args = parser.parse_args()
-    
+    if args.psu is None:
+        args.psu = args.mode not in _TEST_MODES
+    # Per-packet lines go to stdout, next to the PASS/FAIL lines they belong to
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+
+    # Import BPIO client and UART interface
+    from pybpio.bpio_client import BPIOClient
+    from pybpio.bpio_uart import BPIOUART
+
     try:
-        client = BPIOClient(args.port)
-        print(f"Connected to Bus Pirate on {args.port}\n")
-
-        if args.mode == 'buffered':
-            success = uart_buffered_mode(client, speed=args.speed)
-        else:  # callback
-            success = uart_callback_mode(client, speed=args.speed)
-        
-        return 0 if success else 1
-    
+        # The port is closed on every exit path, including errors and Ctrl+C
+        with BPIOClient(args.port) as client:
+            print(f"Connected to Bus Pirate on {args.port}\n")
+            if args.mode in _TEST_MODES:
+                client.show_status()
+
+            uart = BPIOUART(client)
+            try:
+                success = MODES[args.mode](uart, args)
+            finally:
+                uart.stop_async_monitoring()
+
+            # Report anything left in the async buffer
+            buffered_data = uart.read_async()
+            if buffered_data:
+                print(f"Retrieved {len(buffered_data)} bytes of buffered async data")
+
+            return 0 if success else 1
+
+    except KeyboardInterrupt:
+        print("\nExiting...")
+        return 0
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=sys.stderr)
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())